@@ -95,9 +95,13 @@ CREATE INDEX IF NOT EXISTS idx_anime_snapshots_type ON anime_snapshots(type);
 CREATE INDEX IF NOT EXISTS idx_anime_snapshots_status ON anime_snapshots(status);
 
 -- Create unique constraint for upsert operations
-CREATE UNIQUE INDEX IF NOT EXISTS idx_anime_snapshots_unique 
+CREATE UNIQUE INDEX IF NOT EXISTS idx_anime_snapshots_unique
 ON anime_snapshots(mal_id, snapshot_type, snapshot_date);
 
+-- Serve MAX(snapshot_date) per type from the index tip instead of a scan
+CREATE INDEX IF NOT EXISTS idx_anime_snapshots_type_date_desc
+ON anime_snapshots(snapshot_type, snapshot_date DESC);
+
 -- Create function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -4,23 +4,22 @@ Coordinates the entire Extract -> Transform -> Load process.
 """
 
 import asyncio
-import os
-import sys
+import logging
 from datetime import date
 from typing import Any, Dict, cast
 
+import structlog
+
 from src.config import ETL_JOBS, get_settings
-from src.extractors.jikan import JikanExtractor
+from src.extractors.jikan import JikanExtractor, aclose_shared_client
 from src.loaders.database import DatabaseLoader
 from src.logging_config import setup_logging
 from src.metrics_server import ETLJobMetrics, etl_metrics
 from src.transformers.anime import AnimeTransformer
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
-
-# SET UP LOGGING
-logger = setup_logging("etl.pipeline")
+# Lazy proxy - actual logging configuration happens on first pipeline init,
+# so CLI paths like --list-jobs don't pay the setup cost at import time
+logger = structlog.get_logger("etl.pipeline")
 
 
 class ETLPipeline:
@@ -30,9 +29,12 @@ class ETLPipeline:
     """
 
     def __init__(self):
+        # Configure logging once per process, not at module import
+        if not logging.getLogger().handlers:
+            setup_logging("etl.pipeline")
+
         self.settings = get_settings()
         self.extractor = None
-        self.transformer = AnimeTransformer()
         self.loader = DatabaseLoader()
 
         # Start metrics server
@@ -50,6 +52,39 @@ class ETLPipeline:
             "errors": [],
         }
 
+        # Bounded queue for fire-and-forget metrics updates; drained by a
+        # background task so a stalled metrics collector can't block ETL
+        self._metrics_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
+        self._metrics_task = None
+
+    def _ensure_metrics_worker(self):
+        """Start the metrics drain task on the current event loop if needed"""
+        if self._metrics_task is None or self._metrics_task.done():
+            self._metrics_task = asyncio.create_task(self._metrics_worker())
+
+    def _enqueue_metric(self, item: tuple):
+        """Queue a metrics update; drop it if the queue is full"""
+        self._ensure_metrics_worker()
+        try:
+            self._metrics_queue.put_nowait(item)
+        except asyncio.QueueFull:
+            pass
+
+    async def _metrics_worker(self):
+        """Drain queued metrics updates off the critical path"""
+        while True:
+            kind, *args = await self._metrics_queue.get()
+            try:
+                if kind == "processed_records":
+                    job_metrics, count = args
+                    job_metrics.add_processed_records(count)
+                elif kind == "pipeline_health":
+                    etl_metrics.update_pipeline_health(args[0])
+            except Exception as e:
+                logger.error("Metrics update failed", error=str(e))
+            finally:
+                self._metrics_queue.task_done()
+
     async def run_job(self, job_name: str) -> Dict[str, Any]:
         """
         Run a single ETL job by name.
@@ -65,7 +100,11 @@ class ETLPipeline:
 
         job_config = cast(Dict[str, Any], ETL_JOBS[job_name])
 
-        logger.info("Starting ETL job", job_name=job_name, description=job_config.get("description", ""))
+        # Bind job_name once for every log line in this job instead of
+        # threading it through each call as a kwarg
+        structlog.contextvars.bind_contextvars(job_name=job_name)
+
+        logger.info("Starting ETL job", description=job_config.get("description", ""))
 
         job_result: Dict[str, Any] = {
             "job_name": job_name,
@@ -77,82 +116,136 @@ class ETLPipeline:
         }
 
         # Use metrics context manager for job tracking
-        with ETLJobMetrics(job_name) as job_metrics:
-            try:
-                # Initialize extractor
-                self.extractor = JikanExtractor()
-
-                async with self.extractor:
-                    # EXTRACT
-                    logger.info("Starting extraction phase", job_name=job_name)
-                    anime_list = await self.extractor.fetch_by_job_config(job_config)
-
-                    job_result["extraction"] = {
-                        "anime_count": len(anime_list),
-                        "status": "success",
-                    }
+        try:
+            with ETLJobMetrics(job_name) as job_metrics:
+                try:
+                    # Initialize extractor and transformer (job-local so
+                    # concurrent jobs don't share snapshot context or stats)
+                    extractor = JikanExtractor()
+                    transformer = AnimeTransformer()
+
+                    async with extractor:
+                        # EXTRACT + TRANSFORM - pipelined. Extracted anime flow
+                        # through a small bounded queue so each batch is
+                        # transformed while later pages are still being fetched,
+                        # instead of waiting for the full list
+                        logger.info("Starting extraction phase")
+
+                        queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+                        anime_count = 0
+
+                        async def produce():
+                            nonlocal anime_count
+                            batch = []
+                            try:
+                                async for anime in extractor.stream_by_job_config(job_config):
+                                    anime_count += 1
+                                    batch.append(anime)
+                                    if len(batch) >= transformer.batch_size:
+                                        await queue.put(batch)
+                                        batch = []
+                                if batch:
+                                    await queue.put(batch)
+                            finally:
+                                # Always send the end-of-stream sentinel, even on
+                                # failure - otherwise transform_batches would wait
+                                # on the queue forever and the producer's exception
+                                # would never surface through `await producer`
+                                await queue.put(None)
+
+                        async def batches():
+                            while True:
+                                batch = await queue.get()
+                                if batch is None:
+                                    return
+                                yield batch
+
+                        producer = asyncio.create_task(produce())
+                        try:
+                            snapshots = await transformer.transform_batches(
+                                batches(), job_config["snapshot_type"], date.today()
+                            )
+                            await producer
+                        except BaseException:
+                            producer.cancel()
+                            raise
+
+                        job_result["extraction"] = {
+                            "anime_count": anime_count,
+                            "status": "success",
+                        }
+
+                        logger.info("Extraction completed", anime_count=anime_count)
+
+                        if not anime_count:
+                            logger.warning("No anime data extracted")
+                            job_result["status"] = "success_no_data"
+                            return job_result
+
+                        transformation_summary = transformer.get_transformation_summary()
+                    job_result["transformation"] = transformation_summary
 
                     logger.info(
-                        "Extraction completed",
-                        job_name=job_name,
-                        anime_count=len(anime_list),
+                        "Transformation completed",
+                        snapshots_count=len(snapshots),
+                        **transformation_summary["stats"],
                     )
 
-                    if not anime_list:
-                        logger.warning("No anime data extracted", job_name=job_name)
-                        job_result["status"] = "success_no_data"
+                    if not snapshots:
+                        logger.warning("No valid snapshots after transformation")
+                        job_result["status"] = "success_no_valid_data"
                         return job_result
 
-                    # TRANSFORM
-                    logger.info("Starting transformation phase", job_name=job_name)
-                    snapshots = self.transformer.transform_anime_list(
-                        anime_list, job_config["snapshot_type"], date.today()
-                    )
+                    # LOAD - run the blocking psycopg2 insert in a worker thread so
+                    # concurrent jobs keep extracting/transforming on the event loop
+                    logger.info("Starting loading phase")
+                    loading_stats = await asyncio.to_thread(self.loader.load_snapshots, snapshots, upsert=True)
 
-                    transformation_summary = self.transformer.get_transformation_summary()
-                job_result["transformation"] = transformation_summary
+                    job_result["loading"] = loading_stats
 
-                logger.info(
-                    "Transformation completed",
-                    job_name=job_name,
-                    snapshots_count=len(snapshots),
-                    **transformation_summary["stats"],
-                )
+                    logger.info("Loading completed", **loading_stats)
 
-                if not snapshots:
-                    logger.warning("No valid snapshots after transformation", job_name=job_name)
-                    job_result["status"] = "success_no_valid_data"
-                    return job_result
+                    # Update pipeline statistics
+                    self.pipeline_stats["jobs_executed"] += 1
+                    self.pipeline_stats["total_anime_processed"] += anime_count
+                    self.pipeline_stats["total_snapshots_loaded"] += loading_stats["successful_inserts"]
 
-                # LOAD
-                logger.info("Starting loading phase", job_name=job_name)
-                loading_stats = self.loader.load_snapshots(snapshots, upsert=True)
+                    # Track processed records for metrics (off the critical path)
+                    self._enqueue_metric(("processed_records", job_metrics, loading_stats["successful_inserts"]))
 
-                job_result["loading"] = loading_stats
+                    job_result["status"] = "success"
 
-                logger.info("Loading completed", job_name=job_name, **loading_stats)
+                # Freak accident
+                except Exception as e:
+                    error_msg = f"ETL job failed: {str(e)}"
+                    logger.error("ETL job failed", error=error_msg)
 
-                # Update pipeline statistics
-                self.pipeline_stats["jobs_executed"] += 1
-                self.pipeline_stats["total_anime_processed"] += len(anime_list)
-                self.pipeline_stats["total_snapshots_loaded"] += loading_stats["successful_inserts"]
+                    job_result["error"] = error_msg
+                    job_result["status"] = "failed"
 
-                # Track processed records for metrics
-                job_metrics.add_processed_records(loading_stats["successful_inserts"])
+                    self.pipeline_stats["errors"].append({"job_name": job_name, "error": error_msg})
 
-                job_result["status"] = "success"
+        finally:
+            structlog.contextvars.clear_contextvars()
 
-            # Freak accident
-            except Exception as e:
-                error_msg = f"ETL job failed: {str(e)}"
-                logger.error("ETL job failed", job_name=job_name, error=error_msg)
+        return job_result
+
+    async def _run_job_safe(self, job_name: str) -> tuple:
+        """
+        Run a single job and never raise - returns (job_name, result).
 
-                job_result["error"] = error_msg
-                job_result["status"] = "failed"
+        Keeps run_all_jobs' as_completed loop simple: failures are folded
+        into a failed job result instead of cancelling sibling jobs.
+        """
+        try:
+            return job_name, await self.run_job(job_name)
+        except Exception as e:
+            error_msg = f"Failed to run job {job_name}: {str(e)}"
+            logger.error("Job execution failed", job_name=job_name, error=error_msg)
 
-                self.pipeline_stats["errors"].append({"job_name": job_name, "error": error_msg})
+            self.pipeline_stats["errors"].append({"job_name": job_name, "error": error_msg})
 
-        return job_result
+            return job_name, {"status": "failed", "error": error_msg}
 
     async def run_all_jobs(self) -> Dict[str, Any]:
         """
@@ -173,24 +266,15 @@ class ETLPipeline:
             "errors": [],
         }
 
-        # Run each job
-        for job_name in ETL_JOBS.keys():
-            try:
-                job_result = await self.run_job(job_name)
-                pipeline_result["jobs"][job_name] = job_result
-
-                logger.info("Job completed", job_name=job_name, status=job_result["status"])
-
-            except Exception as e:
-                error_msg = f"Failed to run job {job_name}: {str(e)}"
-                logger.error("Job execution failed", job_name=job_name, error=error_msg)
-
-                pipeline_result["jobs"][job_name] = {
-                    "status": "failed",
-                    "error": error_msg,
-                }
+        # Dispatch all jobs up front and consume results as they complete.
+        # Interleaving jobs avoids "stratification": no single downstream
+        # (Jikan or the DB) sees one long homogeneous burst, and the first
+        # rows reach the database as soon as the fastest job finishes.
+        for completed in asyncio.as_completed([self._run_job_safe(job_name) for job_name in ETL_JOBS.keys()]):
+            job_name, job_result = await completed
+            pipeline_result["jobs"][job_name] = job_result
 
-                self.pipeline_stats["errors"].append({"job_name": job_name, "error": error_msg})
+            logger.info("Job completed", job_name=job_name, status=job_result["status"])
 
         # Create summary
         successful_jobs = sum(1 for job in pipeline_result["jobs"].values() if job["status"].startswith("success"))
@@ -206,8 +290,14 @@ class ETLPipeline:
         if failed_jobs > 0:
             pipeline_result["status"] = "completed_with_errors"
 
+        self._enqueue_metric(("pipeline_health", failed_jobs == 0))
+
         logger.info("ETL pipeline completed", **pipeline_result["summary"])
 
+        # Flush pending metrics before returning so one-shot CLI runs don't
+        # exit with updates still queued
+        await self._metrics_queue.join()
+
         return pipeline_result
 
     def test_connections(self) -> Dict[str, bool]:
@@ -249,24 +339,41 @@ async def main():
             print(f"  {job_name}: {job_config['description']}")
         return
 
-    if args.job:
-        # Run specific job
-        if args.job not in ETL_JOBS:
-            print(f"Error: Unknown job '{args.job}'")
-            print("Available jobs:", list(ETL_JOBS.keys()))
-            return
+    try:
+        if args.job:
+            # Run specific job
+            if args.job not in ETL_JOBS:
+                print(f"Error: Unknown job '{args.job}'")
+                print("Available jobs:", list(ETL_JOBS.keys()))
+                return
+
+            result = await pipeline.run_job(args.job)
+            print(f"Job '{args.job}' completed with status: {result['status']}")
+
+            if result["status"] == "failed":
+                print(f"Error: {result['error']}")
+        else:
+            # Run all jobs
+            result = await pipeline.run_all_jobs()
+            print(f"Pipeline completed with status: {result['status']}")
+            print(f"Summary: {result['summary']}")
+    finally:
+        # Flush queued metrics before the loop shuts down - single-job runs
+        # don't pass through run_all_jobs' drain, and asyncio.run would
+        # otherwise cancel the worker with updates still queued
+        await pipeline._metrics_queue.join()
+        # Release the pooled HTTP client before the event loop shuts down
+        await aclose_shared_client()
 
-        result = await pipeline.run_job(args.job)
-        print(f"Job '{args.job}' completed with status: {result['status']}")
 
-        if result["status"] == "failed":
-            print(f"Error: {result['error']}")
-    else:
-        # Run all jobs
-        result = await pipeline.run_all_jobs()
-        print(f"Pipeline completed with status: {result['status']}")
-        print(f"Summary: {result['summary']}")
+if __name__ == "__main__":
+    # uvloop roughly halves event-loop overhead for this I/O-bound pipeline;
+    # fall back to the default loop where it isn't installed
+    try:
+        import uvloop
 
+        uvloop.install()
+    except ImportError:
+        pass
 
-if __name__ == "__main__":
     asyncio.run(main())
@@ -22,20 +22,27 @@ REPLACES: Manual "python b_test_jobs.py" commands
 """
 
 import asyncio
+import os
 import time
 from datetime import datetime
 
+import redis.asyncio as aioredis  # Push-based job dispatch via Redis Streams
 import schedule  # Third-party library for scheduling
 from main import ETLPipeline
 
 # IMPORT EXISTING ETL COMPONENTS (main.py ETL pipeline)
 from src.config import get_settings
+from src.extractors.jikan import aclose_shared_client
 from src.logging_config import setup_logging
 from src.metrics_server import etl_metrics
 
 # Set up logging once at module level
 logger = setup_logging("scheduler")
 
+# Redis Streams configuration for push-based dispatch (--worker / --publish-tick)
+ETL_TICK_STREAM = "etl:tick"
+ETL_CONSUMER_GROUP = "etl-workers"
+
 
 class ETLScheduler:
     """
@@ -72,6 +79,10 @@ class ETLScheduler:
         # CONCURRENCY PROTECTION - prevents multiple jobs from running simultaneously
         self.is_running = False  # Simple flag to prevent job overlap
 
+        # CONNECTION TEST CACHE - (monotonic timestamp, result) of the last
+        # healthy check, so every 5-minute tick doesn't ping the database
+        self._last_conn_test = None
+
     async def run_daily_etl(self):
         """
         Run all ETL jobs for daily data collection
@@ -96,8 +107,19 @@ class ETLScheduler:
         logger.info("Starting daily ETL run", timestamp=datetime.now().isoformat())
 
         try:
-            # STEP 1: TEST CONNECTIONS FIRST
-            connections = self.pipeline.test_connections()  # From main.py
+            # STEP 1: TEST CONNECTIONS FIRST (blocking DB ping -> worker thread).
+            # A healthy result is cached for 10 minutes - the ETL itself fails
+            # cleanly if a connection actually drops between checks.
+            connections = None
+            if self._last_conn_test is not None:
+                checked_at, cached = self._last_conn_test
+                if time.monotonic() - checked_at < 600 and all(cached.values()):
+                    connections = cached
+
+            if connections is None:
+                connections = await asyncio.to_thread(self.pipeline.test_connections)  # From main.py
+                self._last_conn_test = (time.monotonic(), connections)
+
             if not all(connections.values()):
                 logger.error("Connection test failed", connections=connections)
                 return {"status": "failed", "error": "Connection test failed"}
@@ -110,10 +132,18 @@ class ETLScheduler:
             return result
 
         except Exception as e:
-            # ERROR HANDLING: Log but don't crash the scheduler
+            # ERROR HANDLING: Log but don't crash the scheduler.
+            # Invalidate the connection cache so the next tick re-checks.
+            self._last_conn_test = None
             logger.error("Daily ETL failed", error=str(e), exc_info=True)
             return {"status": "failed", "error": str(e)}
 
+        finally:
+            # Each tick runs in its own asyncio.run() loop, so the shared
+            # HTTP client's connections are bound to this loop - close it
+            # here; the next tick lazily rebuilds the pool.
+            await aclose_shared_client()
+
     def schedule_daily_jobs(self):
         """
         Schedule ETL jobs to run daily at specified times
@@ -247,8 +277,15 @@ class ETLScheduler:
                 # CHECK FOR PENDING JOBS - scheduled jobs get executed
                 schedule.run_pending()
 
-                # WAIT 60 SECONDS - prevents excessive CPU usage
-                time.sleep(60)  # Check every minute for due jobs
+                # SLEEP UNTIL THE NEXT SCHEDULED JOB - no fixed-interval polling.
+                # schedule.idle_seconds() is the exact delta to the next run, so
+                # we wake once per job instead of every 60 seconds, and jobs
+                # fire with sub-second precision instead of up to 60s late.
+                sleep_for = schedule.idle_seconds()
+                if sleep_for is None:
+                    sleep_for = 60  # Nothing scheduled - re-check periodically
+                if sleep_for > 0:
+                    time.sleep(min(sleep_for, 60))
 
             except KeyboardInterrupt:
                 # GRACEFUL SHUTDOWN - user pressed Ctrl+C
@@ -259,6 +296,86 @@ class ETLScheduler:
                 logger.error("Scheduler error", error=str(e))
                 time.sleep(300)  # Wait 5 minutes on error before retrying
 
+    async def publish_tick(self, job: str = "all"):
+        """
+        Publish one job tick onto the Redis Stream
+        ==========================================
+
+        This is the PRODUCER side of push-based dispatch: a tiny cron
+        process (or this daemon) XADDs a tick message and exits. Workers
+        started with --worker pick it up via XREADGROUP.
+
+        WHY STREAMS INSTEAD OF POLLING:
+        - Horizontal scaling: several worker processes share one group
+        - Persistence: ticks survive worker crashes and get re-delivered
+        - Per-job acknowledgment replaces the in-process is_running flag
+        """
+        client = aioredis.from_url(self.settings.redis_url)
+        try:
+            message_id = await client.xadd(ETL_TICK_STREAM, {"job": job})
+            logger.info("Published ETL tick", stream=ETL_TICK_STREAM, message_id=message_id, job=job)
+        finally:
+            await client.aclose()
+
+    async def run_stream_worker(self, worker_id: str | None = None):
+        """
+        Consume job ticks from the Redis Stream and run the ETL
+        =======================================================
+
+        This is the CONSUMER side of push-based dispatch. It blocks on
+        XREADGROUP (no polling loop), runs the full ETL for each tick, and
+        XACKs the message only after the run finishes so crashed runs are
+        re-delivered to another worker.
+
+        USAGE:
+        - python scheduler.py --worker            (one worker)
+        - run several containers for horizontal scaling
+
+        PENDING MESSAGES: on startup, entries left pending by a dead worker
+        show up via XPENDING/XAUTOCLAIM inspection; we reclaim anything idle
+        for more than 30 minutes before blocking for new ticks.
+        """
+        worker_id = worker_id or f"worker-{os.getpid()}"
+        client = aioredis.from_url(self.settings.redis_url)
+
+        # Create the consumer group if this is the first worker ever
+        try:
+            await client.xgroup_create(ETL_TICK_STREAM, ETL_CONSUMER_GROUP, id="0", mkstream=True)
+        except aioredis.ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        logger.info("ETL stream worker started", worker_id=worker_id, stream=ETL_TICK_STREAM)
+
+        try:
+            while True:
+                # DEAD-LETTER HANDLING: reclaim ticks a crashed worker left pending
+                claimed = await client.xautoclaim(
+                    ETL_TICK_STREAM, ETL_CONSUMER_GROUP, worker_id, min_idle_time=1_800_000, count=1
+                )
+                messages = [(ETL_TICK_STREAM, claimed[1])] if claimed[1] else await client.xreadgroup(
+                    ETL_CONSUMER_GROUP, worker_id, {ETL_TICK_STREAM: ">"}, count=1, block=30000
+                )
+
+                for _stream, entries in messages:
+                    for message_id, fields in entries:
+                        logger.info("Processing ETL tick", message_id=message_id, fields=fields)
+                        try:
+                            result = await self.run_daily_etl()
+                            logger.info("ETL tick completed", message_id=message_id, status=result.get("status"))
+                        except Exception as e:
+                            logger.error("ETL tick failed", message_id=message_id, error=str(e))
+                        finally:
+                            # Acknowledge even failed runs: run_daily_etl already
+                            # logs and absorbs ETL errors, so re-delivery would
+                            # just repeat the same failure immediately.
+                            await client.xack(ETL_TICK_STREAM, ETL_CONSUMER_GROUP, message_id)
+
+        except KeyboardInterrupt:
+            logger.info("ETL stream worker stopped by user", worker_id=worker_id)
+        finally:
+            await client.aclose()
+
     def run_once_now(self):
         """
         Run ETL once immediately (for testing/manual trigger)
@@ -311,6 +428,8 @@ def main():
     parser.add_argument("--run-once", action="store_true", help="Run ETL once immediately and exit")
     parser.add_argument("--daemon", action="store_true", help="Run as daemon (continuous scheduling)")
     parser.add_argument("--test-schedule", action="store_true", help="Test scheduling (shows next run times)")
+    parser.add_argument("--worker", action="store_true", help="Run as Redis Streams worker (push-based dispatch)")
+    parser.add_argument("--publish-tick", action="store_true", help="Publish one ETL tick to the Redis Stream and exit")
 
     args = parser.parse_args()
 
@@ -333,6 +452,14 @@ def main():
         # CONTINUOUS MODE - production automation
         scheduler.run_scheduler()
 
+    elif args.worker:
+        # PUSH-BASED MODE - consume ticks from the Redis Stream
+        asyncio.run(scheduler.run_stream_worker())
+
+    elif args.publish_tick:
+        # PRODUCER MODE - for cron containers: emit one tick and exit
+        asyncio.run(scheduler.publish_tick())
+
     else:
         # HELP MODE - show usage information
         print("ETL Scheduler Usage:")
@@ -344,4 +471,13 @@ def main():
 
 
 if __name__ == "__main__":
+    # uvloop speeds up every asyncio.run() tick; optional on platforms
+    # without a wheel (e.g. Windows dev machines)
+    try:
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     main()
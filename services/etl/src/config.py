@@ -23,10 +23,14 @@ class ETLSettings(BaseSettings):
     jikan_rate_limit_delay: float = 1.5  # seconds between requests
     jikan_max_retries: int = 3
     jikan_timeout: int = 30
+    jikan_min_concurrency: int = 1  # AIMD floor for concurrent requests
+    jikan_max_concurrency: int = 5  # AIMD ceiling for concurrent requests
+    jikan_cache_ttl: int = 3600  # Response cache TTL in seconds (0 disables)
 
     # ETL Configuration
     debug: bool = False
     log_level: str = "INFO"
+    etl_batch_size: int = 1000  # Rows per loader batch (ETL_BATCH_SIZE)
 
     # Snapshot Configuration
     top_anime_limit: int = 50
@@ -54,6 +58,11 @@ class ETLSettings(BaseSettings):
             if not os.getenv("JIKAN_RATE_LIMIT_DELAY"):
                 self.jikan_rate_limit_delay = 2.0
 
+            # Disable the response cache so CI test runs can't serve each
+            # other stale responses through the shared Redis container
+            if not os.getenv("JIKAN_CACHE_TTL"):
+                self.jikan_cache_ttl = 0
+
             # Reduce limits for faster CI tests
             self.top_anime_limit = 10
             self.seasonal_anime_limit = 5
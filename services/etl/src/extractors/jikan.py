@@ -4,11 +4,15 @@ Handles fetching data from Jikan API with retry logic and rate limiting.
 """
 
 import asyncio  # Async sleep and control flow
+import hashlib
+import json
+import random  # Retry jitter
 import time
-from typing import Any, Dict, List, Optional  # Type hints
+from typing import Any, AsyncIterator, Dict, List, Optional, Union  # Type hints
 
 import httpx  # Async HTTP client
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential  # Retry logic
+import orjson  # Fast JSON parsing for response payloads
+import redis.asyncio as aioredis  # Response cache
 
 from ..config import get_settings
 from ..logging_config import setup_logging
@@ -22,11 +26,81 @@ try:
 except ImportError:
     ETL_METRICS_AVAILABLE = False
 
-from .rate_limiter import JikanRateLimiter
+from .rate_limiter import AdaptiveConcurrencyLimiter, JikanRateLimiter
 
 logger = setup_logging("etl-extractors-jikan")
 
 
+def _noop(*args, **kwargs):
+    """Stand-in for metric recorders when metrics are unavailable"""
+
+
+# Bind the recorders once at import - the hot path makes one call instead of
+# re-testing ETL_METRICS_AVAILABLE and chasing the attribute chain per request
+_record_jikan_request = etl_metrics.record_jikan_request if ETL_METRICS_AVAILABLE else _noop
+_record_jikan_cache = etl_metrics.record_jikan_cache if ETL_METRICS_AVAILABLE else _noop
+
+# Request params may be a plain dict or a pre-encoded httpx.QueryParams
+RequestParams = Union[Dict[str, Any], httpx.QueryParams]
+
+# Shared AIMD limiter - module-level so the learned concurrency limit
+# survives across extractor instances within a scheduler daemon session
+_concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+
+
+def _get_concurrency_limiter(settings) -> AdaptiveConcurrencyLimiter:
+    """Get (or lazily create) the process-wide adaptive concurrency limiter"""
+    global _concurrency_limiter
+    if _concurrency_limiter is None:
+        _concurrency_limiter = AdaptiveConcurrencyLimiter(
+            min_limit=settings.jikan_min_concurrency,
+            max_limit=settings.jikan_max_concurrency,
+        )
+    return _concurrency_limiter
+
+
+# Shared rate limiter - the Jikan quota (3 req/s, 60 req/min) is per client,
+# not per job, so concurrent per-job extractors must draw from one budget
+_rate_limiter: Optional[JikanRateLimiter] = None
+
+
+def _get_rate_limiter(settings) -> JikanRateLimiter:
+    """Get (or lazily create) the process-wide Jikan rate limiter"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = JikanRateLimiter(delay=settings.jikan_rate_limit_delay)
+    return _rate_limiter
+
+
+# Shared HTTP client - one connection pool for all extractor instances, so
+# per-job extractors don't tear down the pool (and TLS session) between runs
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client(settings) -> httpx.AsyncClient:
+    """Get (or lazily rebuild) the process-wide pooled HTTP client"""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        # Single-host client: keep-alive + HTTP/2 multiplexing means page
+        # fetches reuse one TLS connection instead of re-handshaking per call
+        _shared_client = httpx.AsyncClient(
+            base_url=settings.jikan_base_url,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(settings.jikan_timeout, connect=5.0),
+            headers={"User-Agent": "AnimeDashboard-ETL/1.0"},
+        )
+    return _shared_client
+
+
+async def aclose_shared_client():
+    """Close the shared HTTP client - call once at process (or loop) shutdown"""
+    global _shared_client
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+
+
 class JikanAPIError(Exception):
     """Custom exception for Jikan API errors"""
 
@@ -40,11 +114,19 @@ class JikanExtractor:
 
     def __init__(self, rate_limiter: Optional[JikanRateLimiter] = None):
         self.settings = get_settings()
-        self.rate_limiter = rate_limiter or JikanRateLimiter(delay=self.settings.jikan_rate_limit_delay)
-        self.base_url = self.settings.jikan_base_url
-        self.client = httpx.AsyncClient(
-            timeout=self.settings.jikan_timeout,
-            headers={"User-Agent": "AnimeDashboard-ETL/1.0"},
+        self.rate_limiter = rate_limiter or _get_rate_limiter(self.settings)
+        self.client = _get_shared_client(self.settings)
+        # In-flight request registry for single-flight coalescing
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Process-wide AIMD concurrency control (widens until Jikan pushes back)
+        self.concurrency = _get_concurrency_limiter(self.settings)
+        # Response cache - Jikan data changes slowly, so scheduled runs with
+        # identical params can skip the network (and rate limit) entirely
+        self.cache_ttl = self.settings.jikan_cache_ttl
+        self._cache = (
+            aioredis.from_url(self.settings.redis_url, socket_connect_timeout=1.0, socket_timeout=1.0)
+            if self.cache_ttl > 0
+            else None
         )
 
     # Function can pause and let other tasks run
@@ -52,80 +134,297 @@ class JikanExtractor:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((httpx.HTTPError, JikanAPIError)),
-        reraise=True,
-    )
-    async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        # The pooled HTTP client is shared - closing it here would tear down
+        # the connection pool between jobs; aclose_shared_client() does that
+        # once at shutdown. The Redis cache client is instance-local though,
+        # so release its connection pool or per-job extractors leak one per run
+        if self._cache is not None:
+            try:
+                await self._cache.aclose()
+            except Exception as e:
+                logger.warning("Error closing Jikan cache client", error=str(e))
+            self._cache = None
+
+    def _request_key(self, endpoint: str, params: RequestParams) -> str:
+        """Build a stable key identifying a request by endpoint and params"""
+        if isinstance(params, httpx.QueryParams):
+            return f"{endpoint}|{params}"
+        return f"{endpoint}|{json.dumps(params, sort_keys=True, default=str)}"
+
+    def _cache_key(self, request_key: str) -> str:
+        """Build the Redis key for a cached response"""
+        return "jikan:" + hashlib.blake2b(request_key.encode(), digest_size=16).hexdigest()
+
+    async def _cache_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached response; disables the cache on Redis errors"""
+        try:
+            cached = await self._cache.get(cache_key)
+        except Exception as e:
+            logger.warning("Jikan response cache unavailable, disabling", error=str(e))
+            self._cache = None
+            return None
+
+        if cached is None:
+            _record_jikan_cache("miss")
+            return None
+
+        try:
+            data = orjson.loads(cached)
+        except orjson.JSONDecodeError:
+            # Corrupt or incompatible entry - treat it as a miss so one bad
+            # value can't take down the pipeline; the refetch overwrites it
+            logger.warning("Discarding undecodable Jikan cache entry", key=cache_key)
+            _record_jikan_cache("miss")
+            return None
+
+        _record_jikan_cache("hit")
+        return data
+
+    async def _cache_set(self, cache_key: str, data: Dict[str, Any]):
+        """Store a response in the cache; disables the cache on Redis errors"""
+        try:
+            await self._cache.setex(cache_key, self.cache_ttl, orjson.dumps(data))
+        except Exception as e:
+            logger.warning("Jikan response cache unavailable, disabling", error=str(e))
+            self._cache = None
+
+    # ETag entries deliberately outlive the response cache TTL: once the TTL
+    # cache expires we can still revalidate cheaply with If-None-Match
+    _ETAG_TTL = 7 * 24 * 3600
+
+    def _etag_key(self, cache_key: str) -> str:
+        """Redis key holding the last ETag and body for a request"""
+        return cache_key.replace("jikan:", "jikan:etag:", 1)
+
+    async def _etag_get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Fetch the stored {etag, body} entry used for conditional requests"""
+        if self._cache is None:
+            return None
+        try:
+            raw = await self._cache.get(self._etag_key(cache_key))
+            return orjson.loads(raw) if raw else None
+        except Exception:
+            # Redis errors and undecodable entries both just mean "no ETag";
+            # the request proceeds unconditionally
+            return None
+
+    async def _etag_set(self, cache_key: str, etag: str, data: Dict[str, Any]):
+        """Remember a response body under its ETag for future 304 replies"""
+        if self._cache is None:
+            return
+        try:
+            await self._cache.setex(
+                self._etag_key(cache_key), self._ETAG_TTL, orjson.dumps({"etag": etag, "body": data})
+            )
+        except Exception:
+            pass
+
+    async def _make_request(self, endpoint: str, params: RequestParams) -> Dict[str, Any]:
         """
-        Make a request to Jikan API with retry logic and rate limiting.
+        Make a request to Jikan API, coalescing identical concurrent requests.
+
+        A Redis response cache sits in front: a hit skips the network and the
+        rate limiter entirely. If the same (endpoint, params) request is
+        already in flight, await its result instead of issuing a duplicate
+        network call (single-flight).
         """
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
+        # One hashed key serves both the Redis cache and the in-flight
+        # registry, so the canonical request string is serialized only once
+        key = self._cache_key(self._request_key(endpoint, params))
+
+        if self._cache is not None:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            logger.debug("Coalescing duplicate in-flight request", endpoint=endpoint)
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await self._perform_request(endpoint, params, cache_key=key)
+            future.set_result(data)
+            if self._cache is not None:
+                await self._cache_set(key, data)
+            return data
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so abandoned futures don't warn
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _perform_request(
+        self, endpoint: str, params: RequestParams, cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Make a request to Jikan API with retry logic and rate limiting.
 
+        Retries distinguish 429 (obey Retry-After exactly, no extra backoff)
+        from transient transport errors (short jittered backoff); any other
+        error fails fast. If an ETag is known for this request, the call is
+        conditional and a 304 reply reuses the stored body without parsing.
+        """
         # Determine endpoint type for metrics
         endpoint_type = "search" if "anime" == endpoint else "other"
 
-        logger.info("Making Jikan API request", url=url, params=params)
+        etag_entry = await self._etag_get(cache_key) if cache_key is not None else None
 
-        try:
-            # Rate limiting
-            await self.rate_limiter.wait()
+        last_error: Optional[JikanAPIError] = None
 
-            response = await self.client.get(url, params=params)
-            request_duration = time.time() - start_time
+        for attempt in range(self.settings.jikan_max_retries):
+            # Duration is only consumed by metrics - skip the clock read if
+            # metrics are unavailable
+            start_time = time.perf_counter() if ETL_METRICS_AVAILABLE else 0.0
 
-            # Handle rate limiting (429) specially
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
-                logger.warning("Rate limited by Jikan API", retry_after=retry_after)
+            logger.debug("Making Jikan API request", url=endpoint, params=params, attempt=attempt + 1)
 
-                # Record rate limit metrics
-                if ETL_METRICS_AVAILABLE:
-                    etl_metrics.record_jikan_request(endpoint_type, 429, request_duration)
+            await self.concurrency.acquire()
+            throttled = False
+            try:
+                # Rate limiting
+                await self.rate_limiter.wait()
 
-                await asyncio.sleep(retry_after)
-                raise JikanAPIError("Rate limited")
+                # base_url on the client resolves the endpoint path
+                if etag_entry:
+                    response = await self.client.get(
+                        endpoint, params=params, headers={"If-None-Match": etag_entry["etag"]}
+                    )
+                else:
+                    response = await self.client.get(endpoint, params=params)
+                request_duration = time.perf_counter() - start_time if ETL_METRICS_AVAILABLE else 0.0
 
-            # Handle other HTTP errors
-            response.raise_for_status()
+                # Handle rate limiting (429) specially
+                if response.status_code == 429:
+                    throttled = True
+                    retry_after = int(response.headers.get("Retry-After", 60))
+                    logger.warning("Rate limited by Jikan API", retry_after=retry_after)
 
-            data = response.json()
-            logger.info("Jikan API request successful", status_code=response.status_code)
+                    # Record rate limit metrics
+                    _record_jikan_request(endpoint_type, 429, request_duration)
 
-            # Record successful request metrics
-            if ETL_METRICS_AVAILABLE:
-                etl_metrics.record_jikan_request(endpoint_type, response.status_code, request_duration)
+                    # The server told us exactly how long to wait - no
+                    # additional exponential backoff on top
+                    last_error = JikanAPIError("Rate limited")
+                    await asyncio.sleep(retry_after)
+                    continue
 
-            return data
+                # 304 Not Modified - content unchanged, reuse stored body
+                # and skip both the transfer and the JSON parse
+                if response.status_code == 304 and etag_entry is not None:
+                    _record_jikan_cache("etag_hit")
+                    _record_jikan_request(endpoint_type, 304, request_duration)
+                    return etag_entry["body"]
+
+                # Handle other HTTP errors
+                response.raise_for_status()
 
-        except httpx.HTTPError as e:  # Network issues, timeouts, etc.
-            request_duration = time.time() - start_time
-            logger.error("HTTP error during Jikan API request", error=str(e), url=url)
+                # orjson parses the raw bytes 2-5x faster than response.json()
+                data = orjson.loads(response.content)
+                logger.debug("Jikan API request successful", status_code=response.status_code)
 
-            # Record error metrics (use 0 if no status code available)
-            if ETL_METRICS_AVAILABLE:
-                etl_metrics.record_jikan_request(endpoint_type, 0, request_duration)
+                # Record successful request metrics
+                _record_jikan_request(endpoint_type, response.status_code, request_duration)
 
-            raise JikanAPIError(f"HTTP error: {e}")
-        except Exception as e:  # Bugs in code, weird data, etc.
-            request_duration = time.time() - start_time
-            logger.error("Unexpected error during Jikan API request", error=str(e), url=url)
+                etag = response.headers.get("ETag")
+                if etag and cache_key is not None:
+                    await self._etag_set(cache_key, etag, data)
 
-            # Record error metrics
-            if ETL_METRICS_AVAILABLE:
-                etl_metrics.record_jikan_request(endpoint_type, 500, request_duration)
+                return data
 
-            raise JikanAPIError(f"Unexpected error: {e}")
+            except httpx.TransportError as e:  # Timeouts, connection resets - retryable
+                request_duration = time.perf_counter() - start_time if ETL_METRICS_AVAILABLE else 0.0
+                logger.error("HTTP error during Jikan API request", error=str(e), url=endpoint)
+
+                # Record error metrics (use 0 if no status code available)
+                _record_jikan_request(endpoint_type, 0, request_duration)
+
+                last_error = JikanAPIError(f"HTTP error: {e}")
+                await asyncio.sleep(min(2**attempt + random.random(), 8))
+                continue
+
+            except httpx.HTTPError as e:  # Non-transient HTTP errors
+                request_duration = time.perf_counter() - start_time if ETL_METRICS_AVAILABLE else 0.0
+                logger.error("HTTP error during Jikan API request", error=str(e), url=endpoint)
+
+                _record_jikan_request(endpoint_type, 0, request_duration)
+
+                raise JikanAPIError(f"HTTP error: {e}")
+            except Exception as e:  # Bugs in code, weird data, etc.
+                request_duration = time.perf_counter() - start_time if ETL_METRICS_AVAILABLE else 0.0
+                logger.error("Unexpected error during Jikan API request", error=str(e), url=endpoint)
+
+                # Record error metrics
+                _record_jikan_request(endpoint_type, 500, request_duration)
+
+                raise JikanAPIError(f"Unexpected error: {e}")
+            finally:
+                await self.concurrency.release(throttled=throttled)
+
+        raise last_error if last_error is not None else JikanAPIError("Request failed")
+
+    async def _fetch_page(self, base_qp: httpx.QueryParams, page: int) -> JikanSearchResponse:
+        """Fetch and parse a single search results page"""
+        response_data = await self._make_request("/anime", base_qp.set("page", page))
+        return JikanSearchResponse.model_validate(response_data)
+
+    async def iter_anime_search(
+        self, params: Dict[str, Any], max_pages: Optional[int] = None
+    ) -> AsyncIterator[JikanAnime]:
+        """
+        Stream anime from the search endpoint one page at a time.
+
+        The next page's request is started before the current page's anime
+        are yielded, so caller-side processing (transforms, DB writes)
+        overlaps with the next HTTP round trip. Use fetch_anime_search when
+        the whole list is needed up front.
+
+        Yields:
+            JikanAnime objects in page order
+        """
+        # Encode the static params once; only "page" changes per request
+        base_qp = httpx.QueryParams(params)
+        current_page = 1
+        page_task: Optional[asyncio.Task] = asyncio.create_task(self._make_request("/anime", base_qp.set("page", 1)))
+
+        try:
+            while page_task is not None:
+                try:
+                    response_data = await page_task
+                except JikanAPIError as e:
+                    page_task = None
+                    logger.error("Failed to fetch page", page=current_page, error=str(e))
+                    return
+
+                try:
+                    search_response = JikanSearchResponse.model_validate(response_data)
+                except Exception as e:
+                    page_task = None
+                    logger.error("Failed to parse Jikan response", error=str(e), page=current_page)
+                    return
+
+                # Prefetch the next page before handing anime to the caller
+                page_task = None
+                if search_response.pagination.has_next_page and (max_pages is None or current_page < max_pages):
+                    current_page += 1
+                    page_task = asyncio.create_task(self._make_request("/anime", base_qp.set("page", current_page)))
+
+                for anime in search_response.data:
+                    yield anime
+        finally:
+            # Don't leak the prefetch if the caller abandons the iterator
+            if page_task is not None:
+                page_task.cancel()
 
     async def fetch_anime_search(self, params: Dict[str, Any], max_pages: Optional[int] = None) -> List[JikanAnime]:
         """
         Fetch anime data using the search endpoint.
-        Handles pagination automatically.
+        Handles pagination automatically: page 1 is fetched first to learn the
+        page count, then the remaining pages are fetched concurrently (bounded
+        by the adaptive concurrency limiter).
 
         Args:
             params: Query parameters for the search
@@ -134,89 +433,118 @@ class JikanExtractor:
         Returns:
             List of JikanAnime objects
         """
-        all_anime = []
-        current_page = 1
+        # Encode the static params once; only "page" changes per request
+        base_qp = httpx.QueryParams(params)
 
-        while True:
-            # Add pagination to params
-            page_params = {**params, "page": current_page}
+        try:
+            response_data = await self._make_request("/anime", base_qp.set("page", 1))
+        except JikanAPIError as e:
+            logger.error("Failed to fetch page", page=1, error=str(e))
+            return []
 
-            try:
-                response_data = await self._make_request("/anime", page_params)
+        # Validate response structure
+        try:
+            search_response = JikanSearchResponse.model_validate(response_data)
+        except Exception as e:
+            logger.error("Failed to parse Jikan response", error=str(e), page=1)
+            return []
+
+        page_data: List[List[JikanAnime]] = [search_response.data]
+        total_count = len(search_response.data)
+
+        logger.debug(
+            "Fetched anime page",
+            page=1,
+            anime_count=len(search_response.data),
+            total_count=total_count,
+            has_next=search_response.pagination.has_next_page,
+        )
 
-                # Validate response structure
-                try:
-                    search_response = JikanSearchResponse(**response_data)
-                except Exception as e:
-                    logger.error(
-                        "Failed to parse Jikan response",
-                        error=str(e),
-                        page=current_page,
-                    )
-                    break
+        total_pages = search_response.pagination.last_visible_page
+        if max_pages is not None and total_pages > max_pages:
+            logger.info("Reached maximum page limit", max_pages=max_pages)
+            total_pages = max_pages
 
-                # Add anime from this page
-                all_anime.extend(search_response.data)
+        pages_fetched = 1
 
-                logger.info(
-                    "Fetched anime page",
-                    page=current_page,
-                    anime_count=len(search_response.data),
-                    total_count=len(all_anime),
-                    has_next=search_response.pagination.has_next_page,
-                )
+        if search_response.pagination.has_next_page and total_pages > 1:
+            # Remaining pages are independent - fetch them together and keep
+            # result order; a failed page is skipped rather than aborting
+            results = await asyncio.gather(
+                *(self._fetch_page(base_qp, page) for page in range(2, total_pages + 1)),
+                return_exceptions=True,
+            )
 
-                # Check if we should continue
-                if not search_response.pagination.has_next_page:
-                    break
+            for page, result in enumerate(results, start=2):
+                if isinstance(result, BaseException):
+                    logger.error("Failed to fetch page", page=page, error=str(result))
+                    continue
 
-                if max_pages is not None and current_page >= max_pages:
-                    logger.info("Reached maximum page limit", max_pages=max_pages)
-                    break
+                page_data.append(result.data)
+                total_count += len(result.data)
+                pages_fetched += 1
 
-                current_page += 1
+                logger.debug(
+                    "Fetched anime page",
+                    page=page,
+                    anime_count=len(result.data),
+                    total_count=total_count,
+                    has_next=result.pagination.has_next_page,
+                )
 
-            except JikanAPIError as e:
-                logger.error("Failed to fetch page", page=current_page, error=str(e))
-                break
+        # Pre-size the flattened list once and slice-assign each page into
+        # place, instead of growing it with repeated extend() reallocations
+        all_anime: List[JikanAnime] = [None] * total_count  # type: ignore[list-item]
+        offset = 0
+        for data in page_data:
+            all_anime[offset : offset + len(data)] = data
+            offset += len(data)
 
         logger.info(
             "Completed anime search",
             total_anime=len(all_anime),
-            pages_fetched=current_page,
+            pages_fetched=pages_fetched,
         )
         return all_anime
 
     async def fetch_top_anime(self, limit: int = 50) -> List[JikanAnime]:
         """Fetch top-rated anime"""
+        per_page = min(limit, 25)  # Jikan API limit per page
         params = {
             "order_by": "score",
             "sort": "desc",
-            "limit": min(limit, 25),  # Jikan API limit per page
+            "limit": per_page,
             "status": "complete",
         }
-        return await self.fetch_anime_search(params, max_pages=limit // 25 + 1)
+        # Ceiling division - limit // 25 + 1 over-fetched a whole extra page
+        # whenever limit was an exact multiple of the page size
+        results = await self.fetch_anime_search(params, max_pages=-(-limit // per_page))
+        return results[:limit]
 
     async def fetch_seasonal_anime(self, season: str, year: int, limit: int = 25) -> List[JikanAnime]:
         """Fetch seasonal anime"""
+        per_page = min(limit, 25)
         params = {
             "season": season,
             "year": year,
             "order_by": "popularity",
             "sort": "desc",
-            "limit": min(limit, 25),
+            "limit": per_page,
         }
-        return await self.fetch_anime_search(params, max_pages=limit // 25 + 1)
+        results = await self.fetch_anime_search(params, max_pages=-(-limit // per_page))
+        return results[:limit]
 
     async def fetch_upcoming_anime(self, limit: int = 25) -> List[JikanAnime]:
         """Fetch upcoming anime"""
+        per_page = min(limit, 25)
         params = {
             "status": "upcoming",
             "order_by": "popularity",
             "sort": "desc",
-            "limit": min(limit, 25),
+            "limit": per_page,
         }
-        return await self.fetch_anime_search(params, max_pages=limit // 25 + 1)
+        results = await self.fetch_anime_search(params, max_pages=-(-limit // per_page))
+        return results[:limit]
 
     async def fetch_by_job_config(self, job_config: Dict[str, Any]) -> List[JikanAnime]:
         """
@@ -231,6 +559,28 @@ class JikanExtractor:
         else:
             raise ValueError(f"Unsupported endpoint: {endpoint}")
 
+    def stream_by_job_config(self, job_config: Dict[str, Any]) -> AsyncIterator[JikanAnime]:
+        """
+        Stream anime for a job config page by page.
+
+        Same routing as fetch_by_job_config, but returns the paging iterator
+        from iter_anime_search so callers can start processing while later
+        pages are still in flight.
+        """
+        endpoint = job_config["endpoint"]
+        if endpoint != "/anime":
+            raise ValueError(f"Unsupported endpoint: {endpoint}")
+        return self.iter_anime_search(job_config["params"], max_pages=job_config.get("max_pages"))
+
+    async def fetch_many(self, job_configs: List[Dict[str, Any]]) -> List[List[JikanAnime]]:
+        """
+        Fetch several job configs concurrently.
+
+        The shared token bucket interleaves the jobs fairly, so wall-clock
+        time drops from the sum of job durations to roughly the slowest one.
+        """
+        return await asyncio.gather(*(self.fetch_by_job_config(jc) for jc in job_configs))
+
 
 # Utility function for synchronous usage
 def create_extractor() -> JikanExtractor:
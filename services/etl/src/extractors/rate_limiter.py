@@ -1,15 +1,87 @@
 import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket: allows bursts up to `capacity`, then throttles to `rate`
+    tokens per second. Callers only sleep when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 0.0
+                self.last = time.monotonic()
+            else:
+                self.tokens -= 1
 
 
 class JikanRateLimiter:
     """
-    Simple rate limiter for Jikan API requests.
+    Rate limiter for Jikan API requests, keyed to the documented quota
+    (3 requests/second, 60 requests/minute). Token buckets let parallel
+    page fetches burst instead of enforcing a fixed gap between requests.
     """
 
     def __init__(self, delay: float = 1.5):
+        # Kept for callers that tune the limiter by delay; the buckets below
+        # enforce the actual budget
         self.delay = delay
-        self.lock = asyncio.Lock()
+        self.per_second = TokenBucket(rate=3.0, capacity=3)
+        self.per_minute = TokenBucket(rate=1.0, capacity=60)
 
     async def wait(self):
-        async with self.lock:
-            await asyncio.sleep(self.delay)
+        await self.per_second.acquire()
+        await self.per_minute.acquire()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD (additive-increase/multiplicative-decrease) concurrency controller.
+
+    Allows up to `limit` requests in flight. After every `increase_after`
+    consecutive successes the limit grows by 1 (up to `max_limit`); any 429
+    halves it (down to `min_limit`). This probes for the real Jikan capacity
+    on healthy days and backs off to serial behavior when throttled.
+    """
+
+    def __init__(self, min_limit: int = 1, max_limit: int = 5, increase_after: int = 10):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_after = increase_after
+        self.limit = min_limit
+        self._active = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        async with self._condition:
+            while self._active >= self.limit:
+                await self._condition.wait()
+            self._active += 1
+
+    async def release(self, throttled: bool = False):
+        async with self._condition:
+            self._active -= 1
+            if throttled:
+                self._successes = 0
+                self.limit = max(self.min_limit, self.limit // 2)
+            else:
+                self._successes += 1
+                if self._successes >= self.increase_after and self.limit < self.max_limit:
+                    self._successes = 0
+                    self.limit += 1
+            self._condition.notify_all()
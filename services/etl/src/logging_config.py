@@ -4,11 +4,22 @@ Shared logging configuration for all ETL services
 """
 
 import logging
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
+import orjson
 import structlog
 
 
+def _json_dumps(event_dict, **kwargs) -> str:
+    """orjson-backed serializer for structlog's JSONRenderer.
+
+    orjson returns bytes and only knows the JSON types, so decode for the
+    stdlib handlers and fall back to str() for anything exotic.
+    """
+    return orjson.dumps(event_dict, default=str).decode()
+
+
 def setup_logging(service_name: str = "etl"):
     """
     Configure logging for ETL services
@@ -22,19 +33,29 @@ def setup_logging(service_name: str = "etl"):
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
+    # File output: rotate so long-running services can't fill the disk,
+    # and buffer through a MemoryHandler so routine log lines don't each
+    # pay a write() syscall - the buffer flushes when full, on any ERROR,
+    # and at interpreter shutdown
+    file_handler = RotatingFileHandler(
+        log_dir / f"{service_name}.log", maxBytes=64 * 1024 * 1024, backupCount=5
+    )
+    buffered_handler = MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+
     # Configure standard logging
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
             logging.StreamHandler(),  # Console output
-            logging.FileHandler(log_dir / f"{service_name}.log"),  # File output
+            buffered_handler,  # File output
         ],
     )
 
     # Configure structlog
     structlog.configure(
         processors=[
+            structlog.contextvars.merge_contextvars,  # Pick up bind_contextvars context
             structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
@@ -43,7 +64,7 @@ def setup_logging(service_name: str = "etl"):
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_json_dumps),
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -42,6 +42,10 @@ jikan_api_request_duration_seconds = Histogram(
 
 jikan_rate_limit_hits_total = Counter("anime_dashboard_jikan_rate_limit_hits_total", "Total Jikan API rate limit hits")
 
+jikan_cache_events_total = Counter(
+    "anime_dashboard_jikan_cache_events_total", "Jikan response cache hits and misses", ["result"]
+)
+
 # ETL Pipeline Health Metrics
 etl_job_records_per_run = Histogram(
     "anime_dashboard_etl_job_records_per_run",
@@ -62,6 +66,18 @@ etl_database_operations_duration_seconds = Histogram(
     buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
 )
 
+etl_database_operations_total = Counter(
+    "anime_dashboard_etl_database_operations_total",
+    "Database operations by outcome in ETL pipeline",
+    ["operation_type", "status"],
+)
+
+# Memoized .labels() children - label resolution walks a lock-guarded dict
+# inside prometheus_client on every call, so bind each operation's child
+# once and reuse it on the hot path
+_db_operation_timers: dict = {}
+_db_operation_counters: dict = {}
+
 
 class ETLMetricsServer:
     """
@@ -122,9 +138,29 @@ class ETLMetricsServer:
             jikan_rate_limit_hits_total.inc()
             logger.warning("Jikan API rate limit hit", endpoint_type=endpoint_type)
 
-    def record_database_operation(self, operation_type: str, duration: float):
-        """Record database operation metrics"""
-        etl_database_operations_duration_seconds.labels(operation_type=operation_type).observe(duration)
+    def record_jikan_cache(self, result: str):
+        """Record a Jikan response cache hit or miss"""
+        jikan_cache_events_total.labels(result=result).inc()
+
+    def record_database_operation(self, operation_type: str, duration: float, status: str = "success"):
+        """Record database operation metrics.
+
+        operation_type names the operation itself (e.g. "snapshot_upsert_batch");
+        the outcome goes into the status label of the companion counter, so
+        outcomes don't multiply the histogram's label cardinality.
+        """
+        timer = _db_operation_timers.get(operation_type)
+        if timer is None:
+            timer = etl_database_operations_duration_seconds.labels(operation_type=operation_type)
+            _db_operation_timers[operation_type] = timer
+        timer.observe(duration)
+
+        counter_key = (operation_type, status)
+        counter = _db_operation_counters.get(counter_key)
+        if counter is None:
+            counter = etl_database_operations_total.labels(operation_type=operation_type, status=status)
+            _db_operation_counters[counter_key] = counter
+        counter.inc()
 
     def update_pipeline_health(self, is_healthy: bool):
         """Update pipeline health status"""
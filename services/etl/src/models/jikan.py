@@ -148,6 +148,18 @@ class JikanSearchResponse(BaseModel):
 
 
 # Cleaned, Transformed Anime Snapshot Model
+# Column order for bulk loading - the loader's INSERT statements, its COPY
+# stream, and AnimeSnapshot.to_insert_tuple all follow this one definition
+SNAPSHOT_COLUMNS = (
+    "mal_id", "url", "title", "title_english", "title_japanese", "title_synonyms", "titles",
+    "type", "source", "episodes", "status", "airing", "duration", "rating", "score", "scored_by",
+    "rank", "popularity", "members", "favorites", "approved", "season", "year", "aired",
+    "synopsis", "background", "images", "trailer", "genres", "explicit_genres", "themes",
+    "demographics", "studios", "producers", "licensors", "broadcast",
+    "snapshot_type", "snapshot_date",
+)
+
+
 class AnimeSnapshot(BaseModel):
     """Database model for anime snapshots"""
 
@@ -190,6 +202,53 @@ class AnimeSnapshot(BaseModel):
     snapshot_type: str  # 'top', 'seasonal', 'upcoming', etc.
     snapshot_date: date
 
+    def to_insert_tuple(self) -> tuple:
+        """Render the snapshot as a positional row in SNAPSHOT_COLUMNS order.
+
+        Built where the data already lives so the loader doesn't re-walk the
+        model per row; a tuple literal is a single allocation.
+        """
+        return (
+            self.mal_id,
+            self.url,
+            self.title,
+            self.title_english,
+            self.title_japanese,
+            self.title_synonyms,
+            self.titles,
+            self.type,
+            self.source,
+            self.episodes,
+            self.status,
+            self.airing,
+            self.duration,
+            self.rating,
+            self.score,
+            self.scored_by,
+            self.rank,
+            self.popularity,
+            self.members,
+            self.favorites,
+            self.approved,
+            self.season,
+            self.year,
+            self.aired,
+            self.synopsis,
+            self.background,
+            self.images,
+            self.trailer,
+            self.genres,
+            self.explicit_genres,
+            self.themes,
+            self.demographics,
+            self.studios,
+            self.producers,
+            self.licensors,
+            self.broadcast,
+            self.snapshot_type,
+            self.snapshot_date,
+        )
+
     @field_validator("score")
     def validate_score(cls, v):
         """Ensure score is within valid range"""
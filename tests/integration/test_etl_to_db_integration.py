@@ -9,6 +9,9 @@ from pathlib import Path
 import sys
 import os
 
+import psycopg2
+from psycopg2.extras import RealDictCursor
+
 # Add ETL source to Python path (same pattern as existing tests)
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../services/etl'))
 
@@ -20,6 +23,20 @@ from src.models.jikan import JikanAnime
 
 from datetime import date
 
+# Shared read-only connection for the verification queries below. psycopg2
+# has no built-in pool, but one autocommit connection reused across tests
+# amortizes the TCP/auth handshake instead of reconnecting per test.
+_DB_CONN = None
+
+
+def _db_connection(database_url):
+    """Return the shared verification connection, reconnecting if closed"""
+    global _DB_CONN
+    if _DB_CONN is None or _DB_CONN.closed:
+        _DB_CONN = psycopg2.connect(database_url)
+        _DB_CONN.autocommit = True
+    return _DB_CONN
+
 
 class TestETLDatabaseIntegration:
     """Test ETL pipeline integration with real database"""
@@ -40,29 +57,24 @@ class TestETLDatabaseIntegration:
     async def test_database_connection_and_schema(self):
         """Test that we can connect to the running database and verify schema"""
         # Use the working database connectivity pattern from a_test_connections.py
-        import psycopg2
-        
         try:
-            conn = psycopg2.connect(self.settings.database_url)
+            conn = _db_connection(self.settings.database_url)
             cursor = conn.cursor()
-            
-            # Test basic connectivity
-            cursor.execute("SELECT 1;")
-            result = cursor.fetchone()
-            assert result[0] == 1, "Database connection should work"
-            
-            # Check anime_snapshots table exists
+
+            # One round trip covers connectivity, table existence, and the
+            # key columns: connect already validates the socket, and an
+            # empty array means the table (or its columns) is missing
             cursor.execute("""
-                SELECT EXISTS (
-                    SELECT FROM information_schema.tables 
-                    WHERE table_name = 'anime_snapshots'
-                );
+                SELECT array_agg(column_name)
+                FROM information_schema.columns
+                WHERE table_name = 'anime_snapshots'
+                  AND column_name = ANY(ARRAY['mal_id', 'title', 'snapshot_type', 'snapshot_date']);
             """)
-            table_exists = cursor.fetchone()[0]
-            assert table_exists, "anime_snapshots table should exist"
-            
+            columns = cursor.fetchone()[0]
+            assert columns, "anime_snapshots table should exist"
+            assert len(columns) == 4, f"anime_snapshots is missing key columns: found {columns}"
+
             cursor.close()
-            conn.close()
             
         except Exception as e:
             pytest.fail(f"Database connection failed: {e}")
@@ -133,9 +145,6 @@ class TestETLDatabaseIntegration:
     @pytest.mark.asyncio
     async def test_data_persistence_and_retrieval(self):
         """Test that loaded data persists and can be retrieved from database"""
-        import psycopg2
-        from psycopg2.extras import RealDictCursor
-        
         # First, run a small ETL job to ensure we have some data
         job_name = "top_anime"
         job_config = ETL_JOBS[job_name].copy()
@@ -155,7 +164,7 @@ class TestETLDatabaseIntegration:
         
         # Now verify data persistence
         try:
-            conn = psycopg2.connect(self.settings.database_url)
+            conn = _db_connection(self.settings.database_url)
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             # Check that data was actually saved
@@ -186,7 +195,6 @@ class TestETLDatabaseIntegration:
                 assert record['snapshot_date'] is not None, "snapshot_date should not be null"
             
             cursor.close()
-            conn.close()
             
             print(f"    Data persistence verified: {count} records found in database")
             
@@ -316,11 +324,8 @@ class TestETLDatabaseIntegration:
                     f"Should successfully process {job_name} records"
         
         # Verify both snapshot types exist in database
-        import psycopg2
-        from psycopg2.extras import RealDictCursor
-        
         try:
-            conn = psycopg2.connect(self.settings.database_url)
+            conn = _db_connection(self.settings.database_url)
             cursor = conn.cursor(cursor_factory=RealDictCursor)
             
             cursor.execute("""
@@ -337,7 +342,6 @@ class TestETLDatabaseIntegration:
             assert len(snapshot_types_found) > 0, "Should have created records for at least one snapshot type"
             
             cursor.close()
-            conn.close()
             
         except Exception as e:
             pytest.fail(f"Multiple snapshot types verification failed: {e}")
@@ -0,0 +1,107 @@
+"""
+Unit tests for the ETL pipeline orchestrator.
+Covers the queue-pipelined extract/transform wiring in run_job.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+# Add ETL src to path for imports
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../../services/etl'))
+
+import main as etl_main
+from src.extractors.jikan import JikanAPIError
+from src.models.jikan import JikanAnime
+from tests.fixtures.mock_data import MOCK_JIKAN_SEARCH_RESPONSE
+
+@pytest.mark.unit
+class TestETLPipelineRunJob:
+    """Test run_job's pipelined extract/transform behavior"""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Create a pipeline with the loader and metrics stubbed out"""
+        with patch.object(etl_main, "DatabaseLoader"), \
+             patch.object(etl_main, "etl_metrics"), \
+             patch.object(etl_main, "ETLJobMetrics"):
+            instance = etl_main.ETLPipeline()
+            yield instance
+            if instance._metrics_task is not None:
+                instance._metrics_task.cancel()
+
+    @pytest.fixture
+    def sample_anime_list(self):
+        """Create a list of JikanAnime objects for streaming"""
+        return [
+            JikanAnime(**anime_data)
+            for anime_data in MOCK_JIKAN_SEARCH_RESPONSE["data"]
+        ]
+
+    def _mock_extractor(self, stream):
+        """Build a mock JikanExtractor whose stream_by_job_config yields `stream`"""
+        extractor = MagicMock()
+        extractor.__aenter__ = AsyncMock(return_value=extractor)
+        extractor.__aexit__ = AsyncMock(return_value=False)
+        extractor.stream_by_job_config = stream
+        return extractor
+
+    @pytest.mark.asyncio
+    async def test_run_job_success(self, pipeline, sample_anime_list):
+        """Test a successful job run through the streaming pipeline"""
+
+        async def stream(job_config):
+            for anime in sample_anime_list:
+                yield anime
+
+        pipeline.loader.load_snapshots.return_value = {
+            "successful_inserts": 2,
+            "successful_updates": 0,
+            "errors": 0,
+        }
+
+        with patch.object(etl_main, "JikanExtractor", return_value=self._mock_extractor(stream)):
+            result = await asyncio.wait_for(pipeline.run_job("top_anime"), timeout=10)
+
+        assert result["status"] == "success"
+        assert result["extraction"]["anime_count"] == 2
+        assert result["transformation"]["stats"]["successful_transforms"] == 2
+        assert result["loading"]["successful_inserts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_run_job_failing_producer(self, pipeline, sample_anime_list):
+        """Test that an extraction failure mid-stream fails the job instead of hanging"""
+
+        async def stream(job_config):
+            yield sample_anime_list[0]
+            raise JikanAPIError("Jikan exploded mid-stream")
+
+        with patch.object(etl_main, "JikanExtractor", return_value=self._mock_extractor(stream)):
+            # wait_for guards against a regression re-introducing the
+            # missing-sentinel deadlock
+            result = await asyncio.wait_for(pipeline.run_job("top_anime"), timeout=10)
+
+        assert result["status"] == "failed"
+        assert "Jikan exploded mid-stream" in result["error"]
+        pipeline.loader.load_snapshots.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_job_no_data(self, pipeline):
+        """Test that an empty stream reports success_no_data"""
+
+        async def stream(job_config):
+            return
+            yield  # pragma: no cover - makes this an async generator
+
+        with patch.object(etl_main, "JikanExtractor", return_value=self._mock_extractor(stream)):
+            result = await asyncio.wait_for(pipeline.run_job("top_anime"), timeout=10)
+
+        assert result["status"] == "success_no_data"
+        assert result["extraction"]["anime_count"] == 0
+        pipeline.loader.load_snapshots.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
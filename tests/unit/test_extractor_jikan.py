@@ -6,8 +6,8 @@ Tests API extraction logic, retry behavior, and error handling.
 import pytest
 import httpx
 import asyncio
+import orjson
 from unittest.mock import AsyncMock, patch, MagicMock
-from tenacity import RetryError
 
 # Add ETL src to path for imports
 import sys
@@ -32,7 +32,7 @@ class TestJikanExtractor:
         """Mock HTTP response"""
         response = MagicMock()
         response.status_code = 200
-        response.json.return_value = MOCK_JIKAN_SEARCH_RESPONSE
+        response.content = orjson.dumps(MOCK_JIKAN_SEARCH_RESPONSE)
         response.headers = {}
         return response
     
@@ -44,24 +44,29 @@ class TestJikanExtractor:
             
             assert result == MOCK_JIKAN_SEARCH_RESPONSE
             mock_get.assert_called_once_with(
-                'https://api.jikan.moe/v4/anime',
+                '/anime',
                 params={'limit': 25}
             )
     
     @pytest.mark.asyncio
     async def test_rate_limiting_delay(self, extractor):
-        """Test that rate limiting delay is applied"""
+        """Test that the token-bucket limiter allows a burst without sleeping"""
         with patch.object(extractor.client, 'get') as mock_get, \
              patch('asyncio.sleep') as mock_sleep:
-            
+
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = MOCK_JIKAN_SEARCH_RESPONSE
+            mock_response.content = orjson.dumps(MOCK_JIKAN_SEARCH_RESPONSE)
             mock_get.return_value = mock_response
-            
+
+            # Full buckets: the first request spends a token and never sleeps
             await extractor._make_request('/anime', {})
-            
-            mock_sleep.assert_called_once_with(extractor.rate_limiter.delay)
+            mock_sleep.assert_not_called()
+
+            # Drain the per-second bucket - the next request must wait
+            extractor.rate_limiter.per_second.tokens = 0.0
+            await extractor._make_request('/anime', {'page': 2})
+            assert mock_sleep.call_count == 1
     
     @pytest.mark.asyncio
     async def test_429_rate_limit_handling(self, extractor):
@@ -72,7 +77,7 @@ class TestJikanExtractor:
 
         success_response = MagicMock()
         success_response.status_code = 200
-        success_response.json.return_value = MOCK_JIKAN_SEARCH_RESPONSE
+        success_response.content = orjson.dumps(MOCK_JIKAN_SEARCH_RESPONSE)
 
         with patch.object(extractor.client, 'get', side_effect=[rate_limit_response, success_response]), \
             patch('asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
@@ -213,7 +218,8 @@ class TestJikanExtractor:
         }
         
         async def mock_request_side_effect(endpoint, params):
-            if params.get("page") == 1:
+            # params is an httpx.QueryParams, so values come back as strings
+            if int(params.get("page")) == 1:
                 return first_page
             else:
                 # Simulate API error on second page
@@ -252,6 +258,58 @@ class TestJikanExtractor:
             
             mock_fetch.assert_called_once_with(MOCK_ETL_JOB_CONFIG['params'], max_pages=None)
     
+    @pytest.mark.asyncio
+    async def test_stream_by_job_config(self, extractor):
+        """Test streaming anime one by one using job configuration"""
+        with patch.object(extractor, '_make_request', return_value=MOCK_JIKAN_SEARCH_RESPONSE):
+            results = [anime async for anime in extractor.stream_by_job_config(MOCK_ETL_JOB_CONFIG)]
+
+            assert len(results) == 2
+            assert all(isinstance(anime, JikanAnime) for anime in results)
+            assert results[0].title == "Cowboy Bebop"
+            assert results[1].title == "Fullmetal Alchemist"
+
+    @pytest.mark.asyncio
+    async def test_stream_by_job_config_pagination(self, extractor):
+        """Test that streaming follows pagination across pages"""
+        first_page = {
+            "data": [MOCK_JIKAN_SEARCH_RESPONSE["data"][0]],
+            "pagination": {
+                "last_visible_page": 2,
+                "has_next_page": True,
+                "current_page": 1,
+                "items": {"count": 1, "total": 2, "per_page": 1}
+            }
+        }
+        second_page = {
+            "data": [MOCK_JIKAN_SEARCH_RESPONSE["data"][1]],
+            "pagination": {
+                "last_visible_page": 2,
+                "has_next_page": False,
+                "current_page": 2,
+                "items": {"count": 1, "total": 2, "per_page": 1}
+            }
+        }
+
+        with patch.object(extractor, '_make_request', side_effect=[first_page, second_page]):
+            results = [anime async for anime in extractor.stream_by_job_config(MOCK_ETL_JOB_CONFIG)]
+
+            assert len(results) == 2
+            assert results[0].title == "Cowboy Bebop"
+            assert results[1].title == "Fullmetal Alchemist"
+
+    @pytest.mark.asyncio
+    async def test_stream_by_job_config_unsupported_endpoint(self, extractor):
+        """Test error handling for unsupported endpoints when streaming"""
+        invalid_config = {
+            "endpoint": "/unsupported",
+            "params": {},
+            "snapshot_type": "test"
+        }
+
+        with pytest.raises(ValueError, match="Unsupported endpoint"):
+            extractor.stream_by_job_config(invalid_config)
+
     @pytest.mark.asyncio
     async def test_fetch_by_job_config_unsupported_endpoint(self, extractor):
         """Test error handling for unsupported endpoints"""
@@ -301,7 +359,7 @@ class TestJikanExtractor:
         with patch.object(extractor.client, 'get') as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = MOCK_JIKAN_SEARCH_RESPONSE
+            mock_response.content = orjson.dumps(MOCK_JIKAN_SEARCH_RESPONSE)
             mock_get.return_value = mock_response
             
             await extractor._make_request('/anime', {})
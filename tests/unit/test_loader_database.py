@@ -89,14 +89,10 @@ class TestDatabaseLoader:
         assert result["snapshot_type"] == sample_snapshot.snapshot_type
         assert result["snapshot_date"] == sample_snapshot.snapshot_date
         
-        # Test JSON fields are serialized to strings
-        assert isinstance(result["genres"], str)
-        assert isinstance(result["images"], str)
-        
-        # Test that JSON strings can be parsed back to original types
-        import json
-        assert isinstance(json.loads(result["genres"]), list)
-        assert isinstance(json.loads(result["images"]), dict)
+        # JSON columns stay as native types; the Core JSON column type
+        # serializes them on bind
+        assert isinstance(result["genres"], list)
+        assert isinstance(result["images"], dict)
     
     def test_snapshot_to_dict_with_none_score(self, loader):
         """Test conversion when score is None"""
@@ -118,84 +114,87 @@ class TestDatabaseLoader:
     
     def test_load_snapshots_successful(self, loader, sample_snapshots):
         """Test successful loading of snapshots"""
-        mock_session = Mock()
-        
-        # Mock the execute().fetchone() call for duplicate checking
-        mock_result = Mock()
-        mock_result.fetchone.return_value = None  # No existing records
-        mock_session.execute.return_value = mock_result
-        
-        with patch.object(loader, 'SessionLocal', return_value=mock_session):
+        mock_conn = Mock()
+        # RETURNING (xmax = 0): one row freshly inserted, one updated
+        mock_result = MagicMock(returns_rows=True)
+        mock_result.__iter__.return_value = iter([Mock(inserted=True), Mock(inserted=False)])
+        mock_conn.execute.return_value = mock_result
+
+        with patch.object(loader.engine, 'connect', return_value=mock_conn):
             result = loader.load_snapshots(sample_snapshots, batch_size=2, upsert=True)
-            
+
             assert result["total_snapshots"] == 2
-            assert result["successful_inserts"] == 2
+            assert result["successful_inserts"] == 1
+            assert result["successful_updates"] == 1
             assert result["errors"] == 0
-            
-            # Verify session operations
-            mock_session.commit.assert_called()
-            mock_session.close.assert_called()
+
+            # Verify connection operations
+            mock_conn.commit.assert_called()
+            mock_conn.close.assert_called()
     
     def test_load_snapshots_with_duplicates(self, loader, sample_snapshots):
         """Test loading snapshots with duplicate detection"""
-        mock_session = Mock()
-        # Mock existing record for first snapshot
-        mock_session.execute.side_effect = [
-            Mock(fetchone=Mock(return_value=[1])),  # Existing record found
-            Mock(fetchone=Mock(return_value=None)),  # No existing record
-            None, None  # Insert operations
-        ]
-        
-        with patch.object(loader, 'SessionLocal', return_value=mock_session):
+        mock_conn = Mock()
+        # ON CONFLICT DO NOTHING: one of the two rows already existed,
+        # so the statement reports a single affected row
+        mock_conn.execute.return_value = Mock(rowcount=1)
+
+        with patch.object(loader.engine, 'connect', return_value=mock_conn):
             result = loader.load_snapshots(sample_snapshots, batch_size=2, upsert=False)
-            
+
             assert result["total_snapshots"] == 2
             assert result["successful_inserts"] == 1  # Only one inserted
             assert result["duplicate_skips"] == 1  # One duplicate skipped
             assert result["errors"] == 0
-    
+
+    def test_load_snapshots_dedups_within_batch(self, loader, sample_snapshot):
+        """Test that repeated conflict keys within a batch collapse to last-wins"""
+        duplicate = sample_snapshot.model_copy(update={"title": "Newer Title"})
+        mock_conn = Mock()
+        mock_conn.execute.return_value = Mock(rowcount=1)
+
+        with patch.object(loader.engine, 'connect', return_value=mock_conn):
+            result = loader.load_snapshots([sample_snapshot, duplicate], batch_size=2, upsert=False)
+
+            assert result["total_snapshots"] == 2
+            assert result["successful_inserts"] == 1
+            assert result["duplicate_skips"] == 1  # In-batch duplicate dropped
+            assert result["errors"] == 0
+
+        # Only the surviving row should reach the statement, and it should
+        # be the later one
+        rows = mock_conn.execute.call_args[0][1]
+        assert len(rows) == 1
+        assert rows[0]["title"] == "Newer Title"
+
     def test_load_snapshots_with_sql_error(self, loader, sample_snapshots):
         """Test handling of SQL errors during loading"""
-        # Create a mock session
-        mock_session = Mock()
+        mock_conn = Mock()
 
-        # Mock result for SELECT queries
-        mock_result = Mock()
-        mock_result.fetchone.return_value = None
-
-        # Configure execute to return SELECT results first,
-        # then raise error on INSERT, then SELECTs again
-        mock_session.execute.side_effect = [
-            mock_result,                         # SELECT (check existing row)
-            SQLAlchemyError("Database error"),   # INSERT fails
-            mock_result,                         # SELECT for second snapshot
-            mock_result                          # INSERT works
-        ]
+        # The batch executemany fails, taking the whole batch with it
+        mock_conn.execute.side_effect = SQLAlchemyError("Database error")
 
-        with patch.object(loader, 'SessionLocal', return_value=mock_session):
+        with patch.object(loader.engine, 'connect', return_value=mock_conn):
             result = loader.load_snapshots(sample_snapshots, batch_size=2, upsert=False)
-            
+
             assert result["total_snapshots"] == 2
-            assert result["successful_inserts"] == 1  # One succeeded
-            assert result["errors"] == 1  # One failed
-            assert len(result["error_details"]) == 1
-            assert "Database error" in result["error_details"][0]["error"]
+            assert result["successful_inserts"] == 0
+            assert result["errors"] == 2  # Whole batch failed
+            mock_conn.rollback.assert_called_once()
     
     def test_load_snapshots_batch_processing(self, loader, sample_snapshots):
         """Test that large lists are processed in batches"""
         # Create more snapshots than batch size
         many_snapshots = sample_snapshots * 3  # 6 snapshots total
-        
-        mock_session = Mock()
-        mock_session.execute.return_value = None
-        
-        with patch.object(loader, 'SessionLocal', return_value=mock_session), \
+
+        with patch.object(loader.engine, 'connect', return_value=Mock()), \
              patch.object(loader, '_load_batch', return_value={
                  "successful_inserts": 2,
                  "successful_updates": 0,
                  "duplicate_skips": 0,
                  "errors": 0,
-                 "error_details": []
+                 "error_details": [],
+                 "error_details_truncated": 0,
              }) as mock_load_batch:
             
             result = loader.load_snapshots(many_snapshots, batch_size=2)
@@ -204,31 +203,173 @@ class TestDatabaseLoader:
             assert mock_load_batch.call_count == 3
             assert result["successful_inserts"] == 6  # 3 batches * 2 each
     
-    def test_load_batch_no_rollback_on_inner_exceptions(self, loader, sample_snapshots):
-        """Test that session is rolled back on exception"""
-        mock_session = Mock()
-        mock_session.execute.side_effect = Exception("Unexpected error")
-        
-        with patch.object(loader, 'SessionLocal', return_value=mock_session):
-            result = loader._load_batch(sample_snapshots, upsert=True)
-    
-            mock_session.rollback.assert_not_called()
-            mock_session.close.assert_called_once()
-            assert result["errors"] == len(sample_snapshots)
-    
-    def test_load_batch_rollback_on_commit_exception(self, loader, sample_snapshots):
-        """Test that session is rolled back when commit fails"""
-        mock_session = Mock()
-        # Let execute succeed, but make commit fail
-        mock_session.execute.return_value = None
-        mock_session.commit.side_effect = Exception("Commit failed")
-        
-        with patch.object(loader, 'SessionLocal', return_value=mock_session):
-            result = loader._load_batch(sample_snapshots, upsert=True)
-            
-            mock_session.rollback.assert_called_once()
-            mock_session.close.assert_called_once()
+    def test_load_snapshots_discards_rolled_back_counts(self, loader, sample_snapshots):
+        """Test that a mid-group failure backs out uncommitted batch counts"""
+        mock_conn = Mock()
+        calls = {"inserts": 0}
+
+        def execute(stmt, *args):
+            if "SET LOCAL" in str(stmt):
+                return Mock()
+            calls["inserts"] += 1
+            if calls["inserts"] == 1:
+                return Mock(rowcount=1)  # First batch inserts fine
+            raise SQLAlchemyError("Database error")  # Second batch poisons the txn
+
+        mock_conn.execute.side_effect = execute
+
+        with patch.object(loader.engine, 'connect', return_value=mock_conn):
+            result = loader.load_snapshots(sample_snapshots, batch_size=1, upsert=False)
+
+            # The rollback discarded the first batch's insert along with the
+            # failed one - neither may be reported as loaded
+            assert result["successful_inserts"] == 0
+            assert result["errors"] == 2
+            mock_conn.rollback.assert_called_once()
+
+    def test_load_snapshots_parallel_workers(self, loader, sample_snapshots):
+        """Test that workers > 1 loads each batch on its own connection"""
+        connections = []
+
+        def make_connection():
+            conn = Mock()
+            mock_result = MagicMock(returns_rows=True)
+            mock_result.__iter__.return_value = iter([Mock(inserted=True)])
+            conn.execute.return_value = mock_result
+            connections.append(conn)
+            return conn
+
+        with patch.object(loader.engine, 'connect', side_effect=make_connection):
+            result = loader.load_snapshots(sample_snapshots, batch_size=1, upsert=True, workers=2)
+
+            assert result["total_snapshots"] == 2
+            assert result["successful_inserts"] == 2
+            assert result["errors"] == 0
+
+            # One connection per batch, each committed and closed independently
+            assert len(connections) == 2
+            for conn in connections:
+                conn.commit.assert_called_once()
+                conn.close.assert_called_once()
+
+    def test_load_batch_rollback_on_execute_exception(self, loader, sample_snapshots):
+        """Test that a failed batch execute rolls back the whole batch"""
+        mock_conn = Mock()
+        mock_conn.execute.side_effect = Exception("Unexpected error")
+
+        result = loader._load_batch(mock_conn, sample_snapshots, upsert=True)
+
+        mock_conn.rollback.assert_called_once()
+        # The connection belongs to load_snapshots, so the batch must not close it
+        mock_conn.close.assert_not_called()
+        assert result["errors"] == len(sample_snapshots)
+
+    def test_load_snapshots_rollback_on_commit_exception(self, loader, sample_snapshots):
+        """Test that a failed commit rolls back and propagates"""
+        mock_conn = Mock()
+        mock_conn.execute.return_value = MagicMock(returns_rows=False)
+        mock_conn.commit.side_effect = Exception("Commit failed")
+
+        with patch.object(loader.engine, 'connect', return_value=mock_conn):
+            with pytest.raises(Exception, match="Commit failed"):
+                loader.load_snapshots(sample_snapshots, batch_size=2, upsert=True)
+
+            mock_conn.rollback.assert_called_once()
+            mock_conn.close.assert_called_once()
+
+    def test_copy_batch(self, loader, sample_snapshots):
+        """Test the COPY fast path streams rows and commits"""
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+
+        with patch.object(loader.engine, 'raw_connection', return_value=mock_conn):
+            result = loader._copy_batch(sample_snapshots)
+
+            assert result["successful_inserts"] == 2
+            assert result["errors"] == 0
+
+            copy_sql = mock_cursor.copy_expert.call_args[0][0]
+            assert copy_sql.startswith("COPY anime_snapshots")
+            assert "FROM STDIN" in copy_sql
+            mock_conn.commit.assert_called_once()
+            mock_conn.close.assert_called_once()
+
+    def test_copy_batch_rollback_on_error(self, loader, sample_snapshots):
+        """Test that a failed COPY rolls back and fails the whole batch"""
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.__enter__.return_value.copy_expert.side_effect = Exception("duplicate key")
+
+        with patch.object(loader.engine, 'raw_connection', return_value=mock_conn):
+            result = loader._copy_batch(sample_snapshots)
+
             assert result["errors"] == len(sample_snapshots)
+            mock_conn.rollback.assert_called_once()
+            mock_conn.close.assert_called_once()
+
+    def test_copy_upsert_batch(self, loader, sample_snapshots):
+        """Test the staged COPY upsert merges through a temp table"""
+        mock_conn = MagicMock()
+        mock_cursor = mock_conn.cursor.return_value.__enter__.return_value
+        # Merge RETURNING (xmax = 0): one insert, one update
+        mock_cursor.fetchall.return_value = [(True,), (False,)]
+
+        with patch.object(loader.engine, 'raw_connection', return_value=mock_conn):
+            result = loader._copy_upsert_batch(sample_snapshots)
+
+            assert result["successful_inserts"] == 1
+            assert result["successful_updates"] == 1
+            assert result["errors"] == 0
+
+            create_sql = mock_cursor.execute.call_args_list[0][0][0]
+            assert "CREATE TEMP TABLE stg_anime_snapshots" in create_sql
+            copy_sql = mock_cursor.copy_expert.call_args[0][0]
+            assert copy_sql.startswith("COPY stg_anime_snapshots")
+            merge_sql = mock_cursor.execute.call_args_list[1][0][0]
+            assert "ON CONFLICT (mal_id, snapshot_type, snapshot_date) DO UPDATE" in merge_sql
+            mock_conn.commit.assert_called_once()
+            mock_conn.close.assert_called_once()
+
+    def test_convert_batch_caps_error_details(self, loader):
+        """Test that pathological batches don't retain unbounded error dicts"""
+        bad_snapshot = Mock()
+        bad_snapshot.to_insert_tuple.side_effect = ValueError("bad data")
+        bad_snapshot.mal_id = 1
+        bad_snapshot.title = "Broken"
+
+        batch_stats = {
+            "successful_inserts": 0,
+            "successful_updates": 0,
+            "duplicate_skips": 0,
+            "errors": 0,
+            "error_details": [],
+            "error_details_truncated": 0,
+        }
+        batch = [bad_snapshot] * (loader.ERROR_DETAILS_MAX + 50)
+
+        rows = loader._convert_batch(batch, batch_stats)
+
+        assert rows == []
+        assert batch_stats["errors"] == loader.ERROR_DETAILS_MAX + 50
+        assert len(batch_stats["error_details"]) == loader.ERROR_DETAILS_MAX
+        assert batch_stats["error_details_truncated"] == 50
+
+    def test_bulk_load_mode_drops_and_recreates_indexes(self, loader):
+        """Test that bulk_load_mode sheds secondary indexes and rebuilds them"""
+        mock_conn = MagicMock()
+
+        with patch.object(loader.engine, 'begin') as mock_begin:
+            mock_begin.return_value.__enter__.return_value = mock_conn
+
+            with loader.bulk_load_mode():
+                drop_sqls = [str(c[0][0]) for c in mock_conn.execute.call_args_list]
+                assert drop_sqls
+                assert all(sql.startswith("DROP INDEX IF EXISTS") for sql in drop_sqls)
+                # The unique conflict index must survive the drop
+                assert not any("idx_anime_snapshots_unique" in sql for sql in drop_sqls)
+
+            create_sqls = [str(c[0][0]) for c in mock_conn.execute.call_args_list[len(drop_sqls):]]
+            assert len(create_sqls) == len(drop_sqls)
+            assert all(sql.startswith("CREATE INDEX IF NOT EXISTS") for sql in create_sqls)
 
     def test_get_latest_snapshot_date(self, loader):
         """Test getting latest snapshot date"""
@@ -242,6 +383,19 @@ class TestDatabaseLoader:
             assert result == test_date
             mock_session.close.assert_called_once()
     
+    def test_get_latest_snapshot_date_cached(self, loader):
+        """Test that repeat calls within the TTL skip the database"""
+        test_date = date(2024, 1, 15)
+        mock_session = Mock()
+        mock_session.execute.return_value.fetchone.return_value = [test_date]
+
+        with patch.object(loader, 'SessionLocal', return_value=mock_session) as mock_session_local:
+            assert loader.get_latest_snapshot_date("top") == test_date
+            assert loader.get_latest_snapshot_date("top") == test_date
+
+            # Second call served from the cache - one session, one query
+            assert mock_session_local.call_count == 1
+
     def test_get_latest_snapshot_date_no_records(self, loader):
         """Test getting latest snapshot date when no records exist"""
         mock_session = Mock()
@@ -281,43 +435,40 @@ class TestDatabaseLoader:
     def test_upsert_sql_generation(self, loader, sample_snapshot):
         """Test that upsert SQL is generated correctly for conflicts"""
         mock_session = Mock()
-        
-        # Mock the execute().fetchone() call for duplicate checking
-        mock_result = Mock()
-        mock_result.fetchone.return_value = None  # No existing records
-        mock_session.execute.return_value = mock_result
-        
-        with patch.object(loader, 'SessionLocal', return_value=mock_session):
-            loader._load_batch([sample_snapshot], upsert=True)
-            
-            # Should be called multiple times: SELECT for duplicate check + INSERT with ON CONFLICT
-            assert mock_session.execute.call_count >= 2
-            
-            # Check that one of the SQL calls contains ON CONFLICT clause (the upsert)
-            all_calls = mock_session.execute.call_args_list
-            sql_texts = [str(call[0][0]) for call in all_calls]
-            
-            # Look for the ON CONFLICT in any of the SQL statements
-            has_on_conflict = any("ON CONFLICT" in sql for sql in sql_texts)
-            assert has_on_conflict, f"No ON CONFLICT found in SQL calls: {sql_texts}"
-            
-            has_do_update = any("DO UPDATE SET" in sql for sql in sql_texts)
-            assert has_do_update, f"No DO UPDATE SET found in SQL calls: {sql_texts}"
+        mock_session.execute.return_value = MagicMock(returns_rows=False)
+
+        loader._load_batch(mock_session, [sample_snapshot], upsert=True)
+
+        # One executemany call for the whole batch - no per-row SELECT
+        assert mock_session.execute.call_count == 1
+
+        stmt, rows = mock_session.execute.call_args[0]
+        # ON CONFLICT is a PostgreSQL-only clause, so compile explicitly
+        from sqlalchemy.dialects import postgresql
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT" in sql
+        assert "DO UPDATE SET" in sql
+
+        # Parameters are a list of row dicts (executemany form)
+        assert isinstance(rows, list)
+        assert rows[0]["mal_id"] == sample_snapshot.mal_id
     
     def test_simple_insert_sql_generation(self, loader, sample_snapshot):
         """Test that simple insert SQL is generated correctly"""
         mock_session = Mock()
-        # Mock no existing record
-        mock_session.execute.side_effect = [
-            Mock(fetchone=Mock(return_value=None)),  # No existing record
-            None  # Insert operation
-        ]
-        
-        with patch.object(loader, 'SessionLocal', return_value=mock_session):
-            loader._load_batch([sample_snapshot], upsert=False)
-            
-            # Should be called twice: once for check, once for insert
-            assert mock_session.execute.call_count == 2
+        mock_result = Mock()
+        mock_result.rowcount = 1
+        mock_session.execute.return_value = mock_result
+
+        result = loader._load_batch(mock_session, [sample_snapshot], upsert=False)
+
+        # One executemany call - no per-row existence SELECT
+        assert mock_session.execute.call_count == 1
+        from sqlalchemy.dialects import postgresql
+        sql = str(mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT" in sql
+        assert "DO NOTHING" in sql
+        assert result["successful_inserts"] == 1
     
     def test_create_loader_function(self):
         """Test the create_loader utility function"""
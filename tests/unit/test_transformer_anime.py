@@ -79,6 +79,38 @@ class TestAnimeTransformer:
         assert fma.title == "Fullmetal Alchemist"
         assert fma.score == 8.12
     
+    async def test_transform_anime_list_batched(self, transformer, sample_anime_list):
+        """Test that the batched async path matches the synchronous result"""
+        snapshot_type = "seasonal"
+        snapshot_date = date(2024, 1, 15)
+
+        results = await transformer.transform_anime_list_batched(
+            sample_anime_list, snapshot_type, snapshot_date, batch_size=1
+        )
+
+        assert len(results) == 2
+        assert all(isinstance(snapshot, AnimeSnapshot) for snapshot in results)
+        assert all(snapshot.snapshot_type == snapshot_type for snapshot in results)
+        assert transformer.transformation_stats["successful_transforms"] == 2
+
+    async def test_transform_batches(self, transformer, sample_anime_list):
+        """Test transforming batches from an async stream"""
+        snapshot_type = "seasonal"
+        snapshot_date = date(2024, 1, 15)
+
+        async def batches():
+            for anime in sample_anime_list:
+                yield [anime]
+
+        results = await transformer.transform_batches(
+            batches(), snapshot_type, snapshot_date
+        )
+
+        assert len(results) == 2
+        assert all(isinstance(snapshot, AnimeSnapshot) for snapshot in results)
+        assert all(snapshot.snapshot_type == snapshot_type for snapshot in results)
+        assert transformer.transformation_stats["successful_transforms"] == 2
+
     def test_transform_anime_list_default_date(self, transformer, sample_anime_list):
         """Test that default snapshot date is today"""
         results = transformer.transform_anime_list(